@@ -7,11 +7,14 @@ const { spawn } = require('child_process');
 function runLLMScript(scriptPath, inputObj) {
   return new Promise((resolve, reject) => {
     const py = spawn('python3', [scriptPath]);
-    let output = '';
-    let error = '';
-    py.stdout.on('data', data => output += data);
-    py.stderr.on('data', data => error += data);
+    // Collect raw chunks and decode once: a multi-byte UTF-8 character can span two chunks
+    const stdoutChunks = [];
+    const stderrChunks = [];
+    py.stdout.on('data', data => stdoutChunks.push(data));
+    py.stderr.on('data', data => stderrChunks.push(data));
     py.on('close', code => {
+      const output = Buffer.concat(stdoutChunks).toString('utf8');
+      const error = Buffer.concat(stderrChunks).toString('utf8');
       if (code !== 0) {
         // Log both output and error for debugging
         console.error('Python script exited with code', code);
@@ -4,53 +4,157 @@
 
 import sys
 import json
+import logging
 import os
 import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+# Set LLM_DEBUG=1 to include tracebacks in error output
+DEBUG = bool(os.getenv('LLM_DEBUG'))
+
+log = logging.getLogger('conversation_flow')
 
 try:
-    sys.path.append(os.path.join(os.path.dirname(__file__), 'prior scripts'))
-    from llm_interface import get_llm_response_from_context
-except Exception as import_err:
-    print(json.dumps({'error': f'Import error: {import_err}', 'traceback': traceback.format_exc()}))
-    sys.exit(1)
+    import orjson
+except ImportError:
+    orjson = None
+
+def _loads(data):
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects lone-surrogate escapes ("\ud83d") that JSON.stringify emits; the stdlib accepts them
+            pass
+    return json.loads(data)
+
+def _dumps(obj) -> str:
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj).decode()
+        except orjson.JSONEncodeError:
+            # Lone surrogates are not valid UTF-8; let the stdlib escape them
+            return json.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False)
+
+def _write_json(obj):
+    if orjson is not None:
+        try:
+            data = orjson.dumps(obj)
+        except orjson.JSONEncodeError:
+            data = None
+        if data is not None:
+            sys.stdout.buffer.write(data)
+            sys.stdout.buffer.write(b"\n")
+            return
+    # The stdlib path keeps the default ASCII escaping, which also covers lone surrogates
+    json.dump(obj, sys.stdout)
+    sys.stdout.write("\n")
+
+class LLMInterfaceImportError(Exception):
+    pass
+
+# Resolved on first use so importing this module does not construct the OpenAI client
+get_llm_response_from_context = None
+
+def load_llm_interface():
+    global get_llm_response_from_context
+    if get_llm_response_from_context is None:
+        prior_scripts = os.path.join(os.path.dirname(__file__), 'prior scripts')
+        if prior_scripts not in sys.path:
+            sys.path.append(prior_scripts)
+        try:
+            from llm_interface import get_llm_response_from_context
+        except Exception as import_err:
+            raise LLMInterfaceImportError(f'Import error: {import_err}') from import_err
+    return get_llm_response_from_context
+
+# Constant prompt content comes first so repeated turns share a cacheable prefix
+PRD_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are an expert product manager and technical writer. Respond ONLY with the full markdown PRD draft."
+}
+PRD_PROMPT_PREFIX = (
+    "Given the following conversation and the latest user input, generate an updated Product Requirements Document (PRD) draft in markdown format. "
+    "If no changes are needed, return the previous PRD draft as-is.\n\n"
+)
+
+# Non-answers that cannot change the PRD, so the draft update call is skipped for them.
+# Only a bare "thanks" qualifies. "yes", "no", "ok", "okay", "got it" and similar are NOT
+# listed: they usually answer the assistant's last question (e.g. "Shall I add offline
+# mode?") and must still update the draft.
+TRIVIAL_PROMPTS = {"thanks", "thank you"}
+
+def ends_with_trivial_user_turn(messages: list) -> bool:
+    # Judged on the conversation itself, not data['prompt']: /api/prd/answer sends the
+    # user's answer inside `conversation` and no `prompt` key at all.
+    last = messages[-1]
+    content = last.get('content')
+    return (
+        last.get('role') == 'user'
+        and isinstance(content, str)
+        and content.strip().lower().rstrip('.!') in TRIVIAL_PROMPTS
+    )
+
+# Shared by every LLM call in this process
+llm_executor = ThreadPoolExecutor(max_workers=2)
+
+# Produce the assistant reply and updated PRD draft for one request payload
+def run(data: dict) -> dict:
+    prompt = data.get('prompt') or ''
+    conversation = data.get('conversation', [])
+    llm = data.get('llm', 'gpt-3.5-turbo')
+    prev_prd_draft = data.get('prdDraft', '')
+    # Compose messages for LLM: conversation history + new prompt
+    messages = conversation + ([{"role": "user", "content": prompt}] if prompt.strip() else [])
+
+    # --- Add error checks for debugging ---
+    if not prev_prd_draft:
+        log.error('prev_prd_draft is empty!')
+    if not messages:
+        log.error('messages (conversation history) is empty!')
+        # Nothing to respond to, so skip both LLM calls
+        return {"reply": "", "prdDraft": prev_prd_draft}
+    messages_json = _dumps(messages)
+    # The actual values are only logged with LLM_DEBUG set
+    log.debug('prev_prd_draft: %s', prev_prd_draft)
+    log.debug('messages: %s', messages_json)
+
+    # Ask LLM to update the PRD draft. The conversation only grows by appending,
+    # so it goes before the previous draft to keep the shared prefix as long as possible.
+    prd_prompt = (
+        PRD_PROMPT_PREFIX +
+        f"Conversation history (for context):\n{messages_json}\n\n"
+        f"Previous PRD draft (markdown):\n{prev_prd_draft}"
+    )
+    prd_messages = [PRD_SYSTEM_MESSAGE, {"role": "user", "content": prd_prompt}]
+
+    # The reply and the PRD draft only depend on the inputs, so run both calls concurrently
+    llm_call = load_llm_interface()
+    reply_future = llm_executor.submit(llm_call, messages, llm)
+    if prev_prd_draft and ends_with_trivial_user_turn(messages):
+        prd_draft = prev_prd_draft
+    else:
+        prd_draft = llm_executor.submit(llm_call, prd_messages, llm).result()
+    reply = reply_future.result()
+
+    return {"reply": reply, "prdDraft": prd_draft}
 
 def main():
+    # Diagnostics go to stderr; stdout is reserved for the JSON result. LLM_DEBUG only raises
+    # this script's logger, so openai/httpx do not start logging full request payloads.
+    logging.basicConfig(level=logging.WARNING, format='[%(levelname)s] %(message)s')
+    log.setLevel(logging.DEBUG if DEBUG else logging.WARNING)
     try:
-        data = json.loads(sys.stdin.read())
-        prompt = data.get('prompt', '')
-        conversation = data.get('conversation', [])
-        llm = data.get('llm', 'gpt-3.5-turbo')
-        prev_prd_draft = data.get('prdDraft', '')
-        # Compose messages for LLM: conversation history + new prompt
-        messages = conversation + ([{"role": "user", "content": prompt}] if prompt else [])
-
-        # --- Add error checks for debugging ---
-        if not prev_prd_draft:
-            print('[ERROR] prev_prd_draft is empty!', file=sys.stderr)
-        if not messages:
-            print('[ERROR] messages (conversation history) is empty!', file=sys.stderr)
-        # Optionally, print the actual values for further debugging
-        # print('prev_prd_draft:', prev_prd_draft, file=sys.stderr)
-        # print('messages:', json.dumps(messages, ensure_ascii=False), file=sys.stderr)
-
-        reply = get_llm_response_from_context(messages, llm)
-
-        # Ask LLM to update the PRD draft
-        prd_prompt = (
-            "Given the following conversation and the latest user input, generate an updated Product Requirements Document (PRD) draft in markdown format. "
-            "If no changes are needed, return the previous PRD draft as-is.\n\n"
-            f"Previous PRD draft (markdown):\n{prev_prd_draft}\n\n"
-            f"Conversation history (for context):\n{json.dumps(messages, ensure_ascii=False)}\n\n"
-            "Respond ONLY with the full markdown PRD draft."
-        )
-        prd_draft = get_llm_response_from_context([
-            {"role": "system", "content": "You are an expert product manager and technical writer."},
-            {"role": "user", "content": prd_prompt}
-        ], llm)
-
-        print(json.dumps({"reply": reply, "prdDraft": prd_draft}))
+        _write_json(run(_loads(sys.stdin.buffer.read())))
     except Exception as e:
-        print(json.dumps({"error": str(e), "traceback": traceback.format_exc()}))
+        error = {"error": str(e)}
+        if DEBUG:
+            error["traceback"] = traceback.format_exc()
+        _write_json(error)
+        # The backend treats a missing LLM interface as a script failure
+        if isinstance(e, LLMInterfaceImportError):
+            sys.exit(1)
 
 if __name__ == '__main__':
     main()
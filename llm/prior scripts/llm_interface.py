@@ -1,11 +1,24 @@
 import os
-from openai import OpenAI
+import httpx
+from openai import OpenAI, DefaultHttpxClient
 from ui_utils import INFO_COLOR, LOADING_COLOR, RESET_COLOR
 
 if not os.getenv("OPENAI_API_KEY"):
     raise ValueError("OPENAI_API_KEY environment variable is not set")
 
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+# HTTP/2 lets concurrent calls share one connection; httpx needs the optional h2 package for it
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# One shared client with a keep-alive pool so repeated calls reuse connections
+http_client = DefaultHttpxClient(
+    http2=HTTP2_AVAILABLE,
+    limits=httpx.Limits(max_connections=128, max_keepalive_connections=64)
+)
+client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"), http_client=http_client)
 
 def get_llm_response_from_context(messages: list, model_name: str) -> str:
     try:
@@ -1,6 +1,6 @@
 from prd_structure import PRDStructure, PRDSection
 from llm_interface import get_llm_response_from_context
-from ui_utils import record_input, is_uncertain_answer, INFO_COLOR, ASSISTANT_COLOR, RESET_COLOR, write_self_critique
+from ui_utils import record_input, is_uncertain_answer, INFO_COLOR, ASSISTANT_COLOR, RESET_COLOR, write_self_critique, flush_logs
 from question_templates import QUESTION_TEMPLATES
 
 # Step 1: Define a fixed PRD structure (sections and required fields)
@@ -142,6 +142,7 @@ def process_section(section: PRDSection, project_type: str, chosen_model: str) -
             process_section(subtopic, project_type, chosen_model)
 
 def generate_final_prd(prd_structure: PRDStructure, project_type: str) -> str:
+    flush_logs()
     with open("user_responses.txt", "r", encoding="utf-8") as f:
         user_responses_text = f.read()
     with open("self-critiques.txt", "r", encoding="utf-8") as f:
@@ -257,23 +258,27 @@ def parse_prd_structure(response: str) -> PRDStructure:
         )
         prd.add_section(section)
     
+    # Subsections were appended to subtopics directly, bypassing the title index
+    prd.invalidate_index()
     return prd
 
 # Step 4: Section-bounded, context-aware questioning using PRD_SECTIONS and QUESTION_TEMPLATES
 
-def process_prd_sections(prd_sections, industry_domain, project_type):
-    user_inputs = {section['name']: {field: None for field in section['fields']} for section in prd_sections}
-    completed_sections = set()
-    section_order = [section['name'] for section in prd_sections]
-    section_lookup = {section['name']: section for section in prd_sections}
-    idx = 0
-    while idx < len(section_order):
-        section_name = section_order[idx]
-        section = section_lookup[section_name]
-        print(f"\n{ASSISTANT_COLOR}--- Section: {section_name} ---{RESET_COLOR}")
+CONFIRM_PROMPT = f"{INFO_COLOR}Is this section complete and accurate? (yes/no/skip){RESET_COLOR}"
+
+# First letter of a section confirmation -> action; anything else means revisit the section
+CONFIRM_ACTIONS = {'y': 'done', 's': 'skip'}
+
+def confirm_action(confirm: str) -> str:
+    return CONFIRM_ACTIONS.get(confirm[:1].lower(), 'retry')
+
+def build_field_prompts(prd_sections, industry_domain, project_type):
+    # Prompts only depend on the field, domain and project type, so build them (color-wrapped) once per interview
+    field_prompts = {}
+    for section in prd_sections:
         for field in section['fields']:
-            if user_inputs[section_name][field]:
-                continue  # Already answered
+            if field in field_prompts:
+                continue
             template = QUESTION_TEMPLATES.get(field, {})
             prompt = template.get('prompt', f"Please provide details for {field}.")
             followup = template.get('followup', None)
@@ -281,58 +286,75 @@ def process_prd_sections(prd_sections, industry_domain, project_type):
             example = examples.get(project_type, "")
             if example and industry_domain:
                 prompt += f"\nExample for {industry_domain} {project_type}: {example}"
-            answer = record_input(f"{INFO_COLOR}{prompt}{RESET_COLOR}", f"{section_name} - {field}", "").strip()
+            field_prompts[field] = (
+                f"{INFO_COLOR}{prompt}{RESET_COLOR}",
+                f"{INFO_COLOR}{followup}{RESET_COLOR}" if followup else None
+            )
+    return field_prompts
+
+def process_prd_sections(prd_sections, industry_domain, project_type):
+    user_inputs = {section['name']: {field: None for field in section['fields']} for section in prd_sections}
+    field_prompts = build_field_prompts(prd_sections, industry_domain, project_type)
+    completed_sections = set()
+    section_order = [section['name'] for section in prd_sections]
+    # Unanswered fields per section, so revisits only walk what is still missing
+    missing_fields = {section['name']: list(section['fields']) for section in prd_sections}
+    idx = 0
+    while idx < len(section_order):
+        section_name = section_order[idx]
+        print(f"\n{ASSISTANT_COLOR}--- Section: {section_name} ---{RESET_COLOR}")
+        for field in list(missing_fields[section_name]):
+            prompt, followup = field_prompts[field]
+            answer = record_input(prompt, f"{section_name} - {field}", "").strip()
             if not answer or is_uncertain_answer(answer):
                 if followup:
-                    answer2 = record_input(f"{INFO_COLOR}{followup}{RESET_COLOR}", f"{section_name} - {field} (followup)", "").strip()
+                    answer2 = record_input(followup, f"{section_name} - {field} (followup)", "").strip()
                     if answer2:
                         answer = answer2
             user_inputs[section_name][field] = answer
+            if answer:
+                missing_fields[section_name].remove(field)
         # Summarize and validate section
         print(f"\n{ASSISTANT_COLOR}Summary for {section_name}:{RESET_COLOR}")
         for field, value in user_inputs[section_name].items():
             print(f"{field}: {value if value else '[MISSING]'}")
-        confirm = record_input(f"{INFO_COLOR}Is this section complete and accurate? (yes/no/skip){RESET_COLOR}", f"{section_name} confirmation", "").strip().lower()
-        if confirm.startswith('y'):
+        confirm = record_input(CONFIRM_PROMPT, f"{section_name} confirmation", "").strip()
+        action = confirm_action(confirm)
+        if action == 'done':
             completed_sections.add(section_name)
+            flush_logs()
             idx += 1
-        elif confirm.startswith('s'):
+        elif action == 'skip':
             idx += 1  # Allow skip
         else:
             print(f"{INFO_COLOR}Let's revisit this section now.{RESET_COLOR}")
     # After all, offer to revisit incomplete sections
-    incomplete = [s for s in section_order if s not in completed_sections]
+    # Kept in section order and updated in place as sections get completed
+    incomplete = dict.fromkeys(s for s in section_order if s not in completed_sections)
     while incomplete:
         print(f"\n{INFO_COLOR}You have incomplete sections: {', '.join(incomplete)}{RESET_COLOR}")
         revisit = record_input(f"Which section would you like to revisit? (or 'done' to finish) > ", "Revisit Section", "").strip()
         if revisit.lower() == 'done':
             break
         if revisit in incomplete:
-            idx = section_order.index(revisit)
-            section_name = section_order[idx]
-            section = section_lookup[section_name]
-            for field in section['fields']:
-                if user_inputs[section_name][field]:
-                    continue
-                template = QUESTION_TEMPLATES.get(field, {})
-                prompt = template.get('prompt', f"Please provide details for {field}.")
-                followup = template.get('followup', None)
-                examples = template.get('examples', {})
-                example = examples.get(project_type, "")
-                if example and industry_domain:
-                    prompt += f"\nExample for {industry_domain} {project_type}: {example}"
-                answer = record_input(f"{INFO_COLOR}{prompt}{RESET_COLOR}", f"{section_name} - {field}", "").strip()
+            section_name = revisit
+            for field in list(missing_fields[section_name]):
+                prompt, followup = field_prompts[field]
+                answer = record_input(prompt, f"{section_name} - {field}", "").strip()
                 if not answer or is_uncertain_answer(answer):
                     if followup:
-                        answer2 = record_input(f"{INFO_COLOR}{followup}{RESET_COLOR}", f"{section_name} - {field} (followup)", "").strip()
+                        answer2 = record_input(followup, f"{section_name} - {field} (followup)", "").strip()
                         if answer2:
                             answer = answer2
                 user_inputs[section_name][field] = answer
+                if answer:
+                    missing_fields[section_name].remove(field)
             print(f"\n{ASSISTANT_COLOR}Summary for {section_name}:{RESET_COLOR}")
             for field, value in user_inputs[section_name].items():
                 print(f"{field}: {value if value else '[MISSING]'}")
-            confirm = record_input(f"{INFO_COLOR}Is this section complete and accurate? (yes/no/skip){RESET_COLOR}", f"{section_name} confirmation", "").strip().lower()
-            if confirm.startswith('y') or confirm.startswith('s'):
+            confirm = record_input(CONFIRM_PROMPT, f"{section_name} confirmation", "").strip()
+            if confirm_action(confirm) != 'retry':
                 completed_sections.add(section_name)
-        incomplete = [s for s in section_order if s not in completed_sections]
+                del incomplete[section_name]
+                flush_logs()
     return user_inputs
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 @dataclass
 class PRDSection:
@@ -13,33 +13,54 @@ class PRDSection:
 class PRDStructure:
     def __init__(self):
         self.sections: List[PRDSection] = []
+        # Lowercased title -> first section with that title in pre-order (DFS) tree order,
+        # matching the old recursive search. None means stale: rebuilt on the next lookup.
+        # Only add_section keeps it current; see invalidate_index.
+        self._by_title: Optional[Dict[str, PRDSection]] = {}
         
     def add_section(self, section: PRDSection, parent_title: str = None) -> None:
         if parent_title is None:
             self.sections.append(section)
         else:
             parent = self._find_section(parent_title)
-            if parent:
-                section.parent = parent
-                parent.subtopics.append(section)
+            if not parent:
+                return
+            section.parent = parent
+            parent.subtopics.append(section)
+        if self._by_title is not None:
+            key = section.title.lower()
+            if key in self._by_title or section.subtopics:
+                # A duplicate title may come earlier in tree order than the indexed section,
+                # and a section's existing subtopics are not indexed; reindex lazily
+                self._by_title = None
+            else:
+                self._by_title[key] = section
                 
     def _find_section(self, title: str) -> Optional[PRDSection]:
-        def search(sections: List[PRDSection]) -> Optional[PRDSection]:
-            for section in sections:
-                if section.title.lower() == title.lower():
-                    return section
-                result = search(section.subtopics)
-                if result:
-                    return result
-            return None
-        return search(self.sections)
+        if self._by_title is None:
+            self._rebuild_index()
+        return self._by_title.get(title.lower())
+
+    def invalidate_index(self) -> None:
+        # Must be called after renaming sections or appending to subtopics directly,
+        # otherwise lookups can miss those sections or return a later duplicate
+        self._by_title = None
+
+    def _rebuild_index(self) -> None:
+        self._by_title = {}
+        stack = list(reversed(self.sections))
+        while stack:
+            section = stack.pop()
+            self._by_title.setdefault(section.title.lower(), section)
+            stack.extend(reversed(section.subtopics))
 
     def get_all_sections(self) -> List[PRDSection]:
+        # Iterative pre-order walk: no per-level call overhead and no recursion limit
         result = []
-        def collect(sections: List[PRDSection], depth: int = 0):
-            for section in sections:
-                section.depth = depth
-                result.append(section)
-                collect(section.subtopics, depth + 1)
-        collect(self.sections)
+        stack = [(section, 0) for section in reversed(self.sections)]
+        while stack:
+            section, depth = stack.pop()
+            section.depth = depth
+            result.append(section)
+            stack.extend((child, depth + 1) for child in reversed(section.subtopics))
         return result
\ No newline at end of file
@@ -1,32 +1,54 @@
+import atexit
+import re
+
 # Color constants for terminal output
 INFO_COLOR = "\033[94m"       # Blue for instructions and info
 ASSISTANT_COLOR = "\033[92m"  # Green for assistant messages
 LOADING_COLOR = "\033[93m"    # Yellow for loading messages
 RESET_COLOR = "\033[0m"
 
+# Log files stay open in buffered append mode instead of being reopened for every record
+_log_files = {}
+
+def _log_file(path: str):
+    f = _log_files.get(path)
+    if f is None:
+        f = _log_files[path] = open(path, "a", encoding="utf-8", buffering=8192)
+    return f
+
+def flush_logs():
+    for f in _log_files.values():
+        f.flush()
+
+atexit.register(flush_logs)
+
 def write_self_critique(text: str):
-    with open("self-critiques.txt", "a", encoding="utf-8") as f:
-        f.write(text + "\n")
+    _log_file("self-critiques.txt").write(text + "\n")
+
+QA_SEPARATOR = "-" * 40 + "\n"
 
 def record_qa_pair(question: str, explanation: str, answer: str):
-    with open("user_responses.txt", "a", encoding="utf-8") as f:
-        f.write(f"Question: {question}\n")
-        if explanation:
-            f.write(f"Explanation: {explanation}\n")
-        f.write(f"Answer: {answer}\n")
-        f.write("-" * 40 + "\n")
+    lines = [f"Question: {question}\n"]
+    if explanation:
+        lines.append(f"Explanation: {explanation}\n")
+    lines.append(f"Answer: {answer}\n")
+    lines.append(QA_SEPARATOR)
+    _log_file("user_responses.txt").writelines(lines)
 
 def record_input(prompt: str, question: str, explanation: str = "") -> str:
     response = input(prompt)
     record_qa_pair(question, explanation, response)
     return response
 
+UNCERTAIN_KEYWORDS = [
+    "i don't know", "unsure", "not sure", "confused",
+    "no idea", "unclear", "doubt", "hesitant",
+    "don't understand", "uncertain", "not certain",
+    "ambivalent", "i have no clue", "lack clarity",
+    "unspecified", "uncertainty"
+]
+# One case-insensitive alternation scans the answer once, without a lowercased copy
+_UNCERTAIN_RE = re.compile("|".join(map(re.escape, UNCERTAIN_KEYWORDS)), re.IGNORECASE)
+
 def is_uncertain_answer(answer: str) -> bool:
-    uncertain_keywords = [
-        "i don't know", "unsure", "not sure", "confused",
-        "no idea", "unclear", "doubt", "hesitant",
-        "don't understand", "uncertain", "not certain",
-        "ambivalent", "i have no clue", "lack clarity",
-        "unspecified", "uncertainty"
-    ]
-    return any(keyword in answer.lower() for keyword in uncertain_keywords)
+    return _UNCERTAIN_RE.search(answer) is not None